@@ -1,26 +1,36 @@
 # -*- coding: utf-8 -*-
-import os, re, sys, traceback, time, pathlib, click
+import os, re, sys, traceback, time, pathlib, threading, click
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .config import Settings
 from .query import build_search_query
-from .client import fetch_arxiv_feed
-from .parser import parse_feed
-from .output import save_json, save_markdown
+from .client import fetch_arxiv_feed, open_arxiv_feed, STREAM_ERRORS
+from .parser import parse_feed, iter_feed
+from .output import MD_HEADER, output_paths, write_json, markdown_item
 from .summarizer import build_two_stage_summary
-from .llm import call_llm_translate
-from .email_template import render_email_html
-from .exporter import md_to_pdf
+from .session import get_session
+from .dedup import BloomSeen, bloom_path_for, read_seen_ids, write_seen_ids
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso  # C 实现的 ISO-8601 解析，可选
+except Exception:
+    _parse_iso = None
 
 # 进程级防重：本进程内只允许发送一次
 _SENT_EMAIL = False
 
+# 预编译的分隔正则
+_CAT_SPLIT = re.compile(r'\s*[,;/]\s*')
+_KW_SPLIT = re.compile(r'\s*[,;]\s*')
+_STAMP_RE = re.compile(r"arxiv_(\d{8}_\d{6})")
+_EMAIL_LIST_RE = re.compile(r"[;,]")
+
 
 def _split_categories(values):
     out = []
     for v in values or []:
         if not v:
             continue
-        parts = re.split(r'\s*,\s*|\s*;\s*|/', v.strip())
-        out.extend([p for p in parts if p])
+        out.extend(p for p in _CAT_SPLIT.split(v.strip()) if p)
     return out
 
 
@@ -29,25 +39,24 @@ def _split_keywords(values):
     for v in values or []:
         if not v:
             continue
-        parts = re.split(r'\s*,\s*|\s*;\s*', v.strip())
-        out.extend([p for p in parts if p])
+        out.extend(p for p in _KW_SPLIT.split(v.strip()) if p)
     return out
 
 
 def _load_raw_cfg(maybe_path):
-    import yaml
+    from .config import yaml_load
     path = maybe_path or "config.yaml"
     if not os.path.exists(path):
         return {}
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml_load(f) or {}
 
 
 def _extract_stamp_from_path(path: str) -> str:
     """从 outputs/arxiv_YYYYMMDD_HHMMSS.json 推断快照 stamp；兜底为当天日期"""
     try:
         name = os.path.basename(path or "")
-        m = re.search(r"arxiv_(\d{8}_\d{6})", name)
+        m = _STAMP_RE.search(name)
         if m:
             return m.group(1)
     except Exception:
@@ -56,7 +65,8 @@ def _extract_stamp_from_path(path: str) -> str:
 
 
 def _norm_addr(s: str) -> str:
-    return re.sub(r"\s+", "", (s or "")).lower()
+    # 仅用作去重键：str.split() 覆盖全部 Unicode 空白（含全角空格、NBSP）
+    return "".join((s or "").split()).lower()
 
 
 def _dedup_addrs(seq):
@@ -65,7 +75,7 @@ def _dedup_addrs(seq):
     for x in seq or []:
         k = _norm_addr(x)
         if k and k not in seen:
-            out.append(k)
+            out.append((x or "").strip())  # 保留原地址的大小写
             seen.add(k)
     return out
 
@@ -107,8 +117,9 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
         if verbose:
             click.echo("[Run] Start")
 
-        # 1) 载入设置
-        cfg = Settings.from_file(config_path) if config_path else Settings()
+        # 1) 载入设置（YAML 只解析一次，检索设置与其余配置共用）
+        raw_cfg = _load_raw_cfg(config_path)
+        cfg = Settings.from_dict(raw_cfg) if config_path else Settings()
         cats = _split_categories(categories)
         keys = _split_keywords(keywords)
         cfg.merge_cli(categories=cats or None,
@@ -118,7 +129,6 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
                       sort_by=(sort_by or cfg.sort_by),
                       sort_order=(sort_order or cfg.sort_order))
 
-        raw_cfg = _load_raw_cfg(config_path)
         lang = lang or raw_cfg.get("lang", "both")
 
         # 摘要
@@ -157,10 +167,11 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
         since_days = int(fresh_cfg.get("since_days", 0) or 0)          # 近 N 天（0=不启用）
         unique_only = bool(fresh_cfg.get("unique_only", False))        # 跨天去重
         state_path = fresh_cfg.get("state_path", ".state/seen.json")   # 去重状态文件
+        seen_backend = str(fresh_cfg.get("backend", "json") or "json").lower()  # json / bloom
         fallback_when_empty = bool(fresh_cfg.get("fallback_when_empty", False))
         if verbose:
-            click.echo("[Freshness] since_days={}, unique_only={}, state_path='{}', fallback_when_empty={}"
-                       .format(since_days, unique_only, state_path, fallback_when_empty))
+            click.echo("[Freshness] since_days={}, unique_only={}, state_path='{}', backend={}, fallback_when_empty={}"
+                       .format(since_days, unique_only, state_path, seen_backend, fallback_when_empty))
 
         if verbose:
             click.echo("[Run] categories: {}".format(cfg.categories))
@@ -174,38 +185,43 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
             ))
 
         # 2) 查询（分页抓取直到攒够“未读新条目”或触达时间窗）
-        from datetime import datetime, timedelta, timezone
-        import json, pathlib
+        from datetime import datetime
+        import pathlib
 
-        def _parse_dt(s: str):
+        def _parse_ts(s: str):
+            # 返回 epoch 秒（float），内层时间窗比较只剩一次浮点比较
             if not s:
                 return None
-            s = s.replace("Z", "+00:00")
             try:
-                return datetime.fromisoformat(s).astimezone(timezone.utc)
+                if _parse_iso is not None:
+                    return _parse_iso(s).timestamp()
+                return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
             except Exception:
                 return None
 
+        # arXiv / 补链 / LLM 共用一个连接池
+        http = get_session()
+
         q = build_search_query(cfg.categories, cfg.keywords, cfg.logic)
         click.echo("[Query] {}".format(q))
 
-        # 读取已见集合（兼容 list / {"ids":[...]} / {id: timestamp} 三种格式）
+        # 读取已见集合（JSON 兼容 list / {"ids":[...]} / {id: timestamp} 三种格式；bloom 为可选后端）
         seen_ids = set()
+        seen_bloom = None
         if unique_only and state_path:
-            try:
-                if os.path.exists(state_path):
-                    with open(state_path, "r", encoding="utf-8") as f:
-                        j = json.load(f) or {}
-                        if isinstance(j, dict) and "ids" in j:
-                            seen_ids = set(j.get("ids") or [])
-                        elif isinstance(j, dict):
-                            seen_ids = set(j.keys())
-                        elif isinstance(j, list):
-                            seen_ids = set(j)
-            except Exception:
-                seen_ids = set()
+            if seen_backend == "bloom":
+                try:
+                    seen_bloom = BloomSeen.load(state_path)
+                    seen_ids = seen_bloom
+                except Exception as e:
+                    click.secho(f"[Freshness] Bloom 去重不可用，回退 JSON：{e}", fg="yellow")
+            if seen_bloom is None:
+                try:
+                    seen_ids = set(read_seen_ids(state_path))
+                except Exception:
+                    seen_ids = set()
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=since_days) if since_days > 0 else None
+        cutoff_ts = time.time() - since_days * 86400 if since_days > 0 else None
         want_new = int(cfg.max_results or 50)
 
         # 分页参数（可按需改成配置）
@@ -214,51 +230,120 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
         start = 0
         collected, reached_cutoff = [], False
 
-        for _page in range(max_pages):
-            xml = fetch_arxiv_feed(
-                q, start=start, max_results=page_size,
-                sort_by=cfg.sort_by, sort_order=cfg.sort_order
+        def _open_page(st):
+            return open_arxiv_feed(
+                q, start=st, max_results=page_size,
+                sort_by=cfg.sort_by, sort_order=cfg.sort_order, session=http
             )
-            page_items = parse_feed(xml) or []
-            if not page_items:
-                break
 
-            for it in page_items:
+        def _discard(fut):
+            # 丢弃一个预取：未开始则取消；已发出则在拿到响应后立即关闭
+            if not fut.cancel():
+                fut.add_done_callback(lambda f: f.exception() is None and f.result().close())
+
+        # 预取：流式读取第 N 页时，一旦“即使本页剩余条目全部入选也凑不够 want_new”，
+        # 就立即提交第 N+1 页，与本页剩余部分的下载/解析重叠；请求间隔由 client 统一节流（≥3s）。
+        # 每条都入选时（未去重、want_new ≤ page_size）不会触发，不浪费请求；
+        # 之后触达时间窗或页不满时丢弃该预取。
+        # 按日期降序时，遇到第一条早于时间窗的条目即可判定本页其余与后续页都更旧
+        newest_first = (cfg.sort_order or "descending").lower() == "descending"
+        # 去重集合提到循环外：未启用去重时为空集合，内层只剩一次成员测试
+        skip_ids = seen_ids if unique_only else frozenset()
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        pending = None
+
+        def _consume(entries, can_prefetch):
+            # 逐条过滤一页 entry，返回本页条目数；触达时间窗时置 reached_cutoff
+            nonlocal reached_cutoff, pending
+            n = 0
+            for it in entries:
+                # 放在所有过滤之前：被去重/时间窗跳过的条目同样计入判断
+                if can_prefetch and pending is None and len(collected) + page_size - n < want_new:
+                    pending = prefetcher.submit(_open_page, start + page_size)
+                n += 1
                 # 时间窗（按 updated 优先；无则退回 published）
-                t = _parse_dt(it.get("updated")) or _parse_dt(it.get("published"))
-                if cutoff and t and t < cutoff:
+                t = _parse_ts(it.get("updated")) or _parse_ts(it.get("published"))
+                if cutoff_ts is not None and t is not None and t < cutoff_ts:
+                    if not newest_first:
+                        continue  # 升序：旧条目在前，跳过即可
                     reached_cutoff = True
                     break
 
                 # 去重
                 aid = it.get("id")
-                if unique_only and aid and aid in seen_ids:
+                if aid and aid in skip_ids:
                     continue
 
                 collected.append(it)
                 if len(collected) >= want_new:
                     break
+            return n
 
-            if len(collected) >= want_new or reached_cutoff:
-                break
+        try:
+            for _page in range(max_pages):
+                resp = pending.result() if pending is not None else _open_page(start)
+                pending = None
+                can_prefetch = _page + 1 < max_pages
+                base = len(collected)
+
+                # 边下载边解析：一条条消费 entry，提前 break 时不再解析剩余部分
+                feed = iter_feed(resp.raw)
+                try:
+                    n_entries = _consume(feed, can_prefetch)
+                except STREAM_ERRORS as e:
+                    # 响应体读取/解析中途失败（读超时、连接中断、XML 截断）：回滚本页已收条目，
+                    # 改用完整下载重取本页（走 _do_get 的重试退避与 HTTPS→HTTP 回退）
+                    click.secho(f"[Query] 第 {_page + 1} 页流式读取失败，改为完整下载重试: {e}", fg="yellow")
+                    del collected[base:]
+                    reached_cutoff = False
+                    if pending is not None:
+                        _discard(pending)
+                        pending = None
+                    xml = fetch_arxiv_feed(
+                        q, start=start, max_results=page_size,
+                        sort_by=cfg.sort_by, sort_order=cfg.sort_order, session=http
+                    )
+                    n_entries = _consume(iter(parse_feed(xml)), can_prefetch)
+                finally:
+                    # 提前结束时停止解析并断开连接，页尾不再下载/解析
+                    feed.close()
+                    resp.close()
+
+                if not n_entries:
+                    break
 
-            if len(page_items) < page_size:
-                # 已无更多可翻页内容
-                break
+                if len(collected) >= want_new or reached_cutoff:
+                    break
+
+                if n_entries < page_size:
+                    # 已无更多可翻页内容
+                    break
 
-            start += page_size
+                start += page_size
+        finally:
+            # 提前结束（凑够/触达时间窗/页不满）时丢弃多余的预取
+            if pending is not None:
+                _discard(pending)
+            prefetcher.shutdown(wait=False, cancel_futures=True)
 
         # Fallback：若空且允许回退，则给最新一页（不考虑去重/时间窗）
         if not collected and fallback_when_empty:
             xml = fetch_arxiv_feed(
                 q, start=0, max_results=want_new,
-                sort_by=cfg.sort_by, sort_order=cfg.sort_order
+                sort_by=cfg.sort_by, sort_order=cfg.sort_order, session=http
             )
             collected = parse_feed(xml) or []
 
         items = collected
         if not items:
             click.secho("[Info] No new items after pagination/freshness/dedup filter.", fg="yellow")
+            # 无新增时后续（补链/摘要/文件/站点/邮件）都是空输出，去重状态也无需更新：直接结束
+            site_cfg = raw_cfg.get("site") or {}
+            if email_cfg.get("skip_when_empty", True) and not site_cfg.get("always_regen", False):
+                click.echo("[Info] 跳过输出（email.skip_when_empty=true 且 site.always_regen=false）")
+                if verbose:
+                    click.echo("[Run] Done")
+                return
         else:
             click.echo(f"[Info] Fetched {len(items)} new item(s) after pagination/dedup.")
 
@@ -268,14 +353,42 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
         scrape_pdf_if_missing = bool(scrape_cfg.get("pdf_if_missing", True))
         scrape_pdf_always = bool(scrape_cfg.get("pdf_first_page", False))
         scrape_to = int(scrape_cfg.get("timeout", 10))
+        scrape_workers = max(1, int(scrape_cfg.get("concurrency", 16) or 1))
 
         from .extrascrape import augment_item_links
 
         if verbose:
             click.echo(f"[Scrape] html={scrape_html} pdf_if_missing={scrape_pdf_if_missing} "
-                       f"pdf_first_page={scrape_pdf_always} timeout={scrape_to}")
+                       f"pdf_first_page={scrape_pdf_always} timeout={scrape_to} concurrency={scrape_workers}")
 
-        for it in items:
+        # 3) 补链 + 摘要 + 翻译：同一个线程池内流水线执行。
+        # 每条论文一个任务（补链 -> 中文摘要 -> 英文摘要），翻译按批次作为独立任务并行投递；
+        # 各环节打到不同服务，互相重叠等待。LLM 并发仍分别受 llm.concurrency / translate_concurrency 限制。
+        summaries_zh, summaries_en, translations = {}, {}, {}
+        llm_workers = max(1, int(llm_cfg.get("concurrency", 8) or 1))
+        llm_gate = threading.Semaphore(llm_workers)
+
+        tx_chunks, tx_workers = [], 1
+        if trans_cfg.get("enabled") and (trans_cfg.get("lang", "zh") == "zh"):
+            api_key = (llm_cfg.get("api_key")
+                       or os.getenv(llm_cfg.get("api_key_env") or "OPENAI_API_KEY", ""))
+            if not api_key:
+                click.secho("[Translate] 跳过：未找到 LLM API Key（配置 llm.api_key 或设置环境变量 {}）"
+                            .format(llm_cfg.get("api_key_env") or "OPENAI_API_KEY"), fg="yellow")
+            elif items:
+                from .llm import call_llm_translate, call_llm_translate_batch
+                tx_workers = max(1, int(llm_cfg.get("translate_concurrency", 8) or 1))
+                tx_batch = max(1, int(llm_cfg.get("translate_batch", 5) or 1))
+                tx_chunks = [items[i:i + tx_batch] for i in range(0, len(items), tx_batch)]
+        tx_gate = threading.Semaphore(tx_workers)
+
+        def _summarize(it, L):
+            with llm_gate:
+                return build_two_stage_summary(item=it, mode=mode, lang=L, scope=scope, llm_cfg=llm_cfg)
+
+        def _process_item(it):
+            # 补链失败不影响摘要；异常带回主线程统一输出
+            added, scrape_err = 0, None
             try:
                 added = augment_item_links(
                     it,
@@ -283,72 +396,106 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
                     pdf_if_missing=scrape_pdf_if_missing,
                     pdf_first_page=scrape_pdf_always,
                     timeout=scrape_to,
+                    session=http,
                 )
-                if verbose and added > 0:
-                    click.echo(f"[Scrape] +{added} code link(s) for {(it.get('id') or '')[:32]}")
             except Exception as e:
-                click.secho(f"[Scrape] 补链失败 {(it.get('id') or '')[:18]}...: {e}", fg="yellow")
-
-        # 3) 摘要
-        summaries_zh, summaries_en = {}, {}
-        def _sum_for_lang(L):
-            out = {}
-            for it in items:
-                sid = it.get("id") or ""
-                out[sid] = build_two_stage_summary(item=it, mode=mode, lang=L, scope=scope, llm_cfg=llm_cfg)
-            return out
-
-        if lang in ("zh", "both"):
-            summaries_zh = _sum_for_lang("zh")
-        if lang in ("en", "both"):
-            summaries_en = _sum_for_lang("en")
-
-        # 4) 翻译（中文）
-        translations = {}
-        if trans_cfg.get("enabled") and (trans_cfg.get("lang", "zh") == "zh"):
-            api_key = (llm_cfg.get("api_key")
-                       or os.getenv(llm_cfg.get("api_key_env") or "OPENAI_API_KEY", ""))
-            if not api_key:
-                click.secho("[Translate] 跳过：未找到 LLM API Key（配置 llm.api_key 或设置环境变量 {}）"
-                            .format(llm_cfg.get("api_key_env") or "OPENAI_API_KEY"), fg="yellow")
-            else:
-                for it in items:
+                scrape_err = e
+            s_zh = _summarize(it, "zh") if lang in ("zh", "both") else None
+            s_en = _summarize(it, "en") if lang in ("en", "both") else None
+            return added, scrape_err, s_zh, s_en
+
+        def _translate_chunk(chunk):
+            kw = dict(
+                target_lang="zh",
+                base_url=llm_cfg.get("base_url", ""),
+                model=llm_cfg.get("model", ""),
+                api_key=api_key,
+                system_prompt=llm_cfg.get("system_prompt_translate_zh", ""),
+                session=http,
+            )
+            out, errs, batch_err = {}, {}, None
+            with tx_gate:
+                if len(chunk) > 1:
+                    try:
+                        out = call_llm_translate_batch(items=chunk, **kw)
+                    except Exception as e:
+                        out, batch_err = {}, e  # 批量请求失败/结果无法解析：整批逐条回退
+                # 批量缺失的条目逐条补译
+                for it in chunk:
                     sid = it.get("id") or ""
+                    if sid in out:
+                        continue
                     try:
-                        translations[sid] = call_llm_translate(
-                            item=it, target_lang="zh",
-                            base_url=llm_cfg.get("base_url", ""),
-                            model=llm_cfg.get("model", ""),
-                            api_key=api_key,
-                            system_prompt=llm_cfg.get("system_prompt_translate_zh", "")
-                        )
+                        out[sid] = call_llm_translate(item=it, **kw)
                     except Exception as e:
-                        click.secho(f"[Translate] 失败 {sid[:18]}...: {e}", fg="red")
-
-        # 5) 终端预览
+                        errs[sid] = e
+            return out, errs, batch_err
+
+        if items:
+            n_tasks = len(items) + len(tx_chunks)
+            pipe_workers = max(scrape_workers, llm_workers, tx_workers)
+            with ThreadPoolExecutor(max_workers=min(pipe_workers, n_tasks)) as ex:
+                # 执行器按 FIFO 取任务：每个翻译批次先于其覆盖的论文任务投递，翻译不会全部排在队尾
+                # （tx_chunks 是 items 的顺序切片，未启用翻译时整体作为一组）
+                futures = {}
+                for group in (tx_chunks or [items]):
+                    if tx_chunks:
+                        futures[ex.submit(_translate_chunk, group)] = ("translate", group)
+                    for it in group:
+                        futures[ex.submit(_process_item, it)] = ("item", it)
+                # 日志在主线程按完成顺序输出
+                for fut in as_completed(futures):
+                    kind, obj = futures[fut]
+                    if kind == "translate":
+                        done, errs, batch_err = fut.result()
+                        if batch_err is not None:
+                            click.secho(f"[Translate] batch failed, falling back: {batch_err}", fg="yellow")
+                        translations.update(done)
+                        for sid, e in errs.items():
+                            click.secho(f"[Translate] 失败 {sid[:18]}...: {e}", fg="red")
+                        continue
+                    sid = obj.get("id") or ""
+                    try:
+                        added, scrape_err, s_zh, s_en = fut.result()
+                    except Exception as e:
+                        click.secho(f"[Summary] 失败 {sid[:18]}...: {e}", fg="red")
+                        continue
+                    if scrape_err is not None:
+                        click.secho(f"[Scrape] 补链失败 {sid[:18]}...: {scrape_err}", fg="yellow")
+                    elif verbose and added > 0:
+                        click.echo(f"[Scrape] +{added} code link(s) for {sid[:32]}")
+                    if s_zh is not None:
+                        summaries_zh[sid] = s_zh
+                    if s_en is not None:
+                        summaries_en[sid] = s_en
+
+        # 5) 终端预览 + 保存到文件（单次遍历：预览与 Markdown 逐条输出，JSON 最后一次写出）
+        json_path, md_path = output_paths(out_dir)
         if not items:
             click.echo("（今日暂无新增）")
-        for idx, it in enumerate(items, 1):
-            title = it.get("title", "")
-            venue = it.get("venue_inferred") or (it.get("journal_ref") or "")
-            click.echo(f"{idx:02d}. {title}  [{' / '.join(it.get('authors', []))}]")
-            if venue:
-                click.echo(f"    Venue: {venue}")
-            click.echo(f"    Time: {it.get('published', '—')}  ->  {it.get('updated', '—')}")
-            if it.get("pdf_url"):
-                click.echo(f"    PDF : {it['pdf_url']}")
-            sid = it.get("id") or ""
-            s = (summaries_zh.get(sid) or summaries_en.get(sid) or {})
-            if s.get("tldr"):
-                click.echo(f"    TL;DR: {s['tldr']}")
-            tx = translations.get(sid)
-            if tx and tx.get("title_zh"):
-                click.echo(f"    标题(中): {tx['title_zh']}")
-            click.echo("")
-
-        # 6) 保存到文件 + 生成 PDF（可选）
-        json_path = save_json(items, out_dir)
-        md_path   = save_markdown(items, out_dir, summaries_zh, summaries_en, lang=lang, translations=translations)
+        with open(md_path, "w", encoding="utf-8") as md:
+            md.write(MD_HEADER)
+            for idx, it in enumerate(items, 1):
+                title = it.get("title", "")
+                venue = it.get("venue_inferred") or (it.get("journal_ref") or "")
+                click.echo(f"{idx:02d}. {title}  [{' / '.join(it.get('authors', []))}]")
+                if venue:
+                    click.echo(f"    Venue: {venue}")
+                click.echo(f"    Time: {it.get('published', '—')}  ->  {it.get('updated', '—')}")
+                if it.get("pdf_url"):
+                    click.echo(f"    PDF : {it['pdf_url']}")
+                sid = it.get("id") or ""
+                s = (summaries_zh.get(sid) or summaries_en.get(sid) or {})
+                if s.get("tldr"):
+                    click.echo(f"    TL;DR: {s['tldr']}")
+                tx = translations.get(sid)
+                if tx and tx.get("title_zh"):
+                    click.echo(f"    标题(中): {tx['title_zh']}")
+                click.echo("")
+                md.write(markdown_item(idx, it, summaries_zh, summaries_en, lang=lang, translations=translations))
+
+        # 6) JSON 落盘 + 生成 PDF（可选）
+        write_json(items, json_path)
         click.echo(f"Saved: {json_path}")
         click.echo(f"Saved: {md_path}")
 
@@ -366,9 +513,9 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
                 accent = site_cfg.get("accent", "#2563eb")
                 site_res = generate_site(
                     items=items,
-                    summaries_zh=summaries_zh or {},
-                    summaries_en=summaries_en or {},
-                    translations=translations or {},
+                    summaries_zh=summaries_zh,
+                    summaries_en=summaries_en,
+                    translations=translations,
                     site_dir=sd, site_title=title, keep_runs=keep,
                     theme=theme, accent=accent
                 )
@@ -383,6 +530,7 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
         pdf_path = ""
         if pdf_enabled:
             try:
+                from .exporter import md_to_pdf  # xhtml2pdf 较重，仅在需要时加载
                 pdf_path = md_to_pdf(md_path)
                 click.echo(f"Saved: {pdf_path}")
             except Exception as e:
@@ -417,7 +565,7 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
                 if email_cfg.get("enabled"):
                     # 环境变量优先（适合 GitHub Actions）
                     env_to = os.getenv("EMAIL_TO", "")
-                    to_list = [x.strip() for x in re.split(r"[;,]", env_to) if x.strip()] if env_to else (email_cfg.get("to") or [])
+                    to_list = [x.strip() for x in _EMAIL_LIST_RE.split(env_to) if x.strip()] if env_to else (email_cfg.get("to") or [])
                     sender_env = os.getenv("EMAIL_SENDER", "")
                     sender = sender_env or (email_cfg.get("sender") or "")
                     server  = email_cfg.get("smtp_server") or "smtp.qq.com"
@@ -433,16 +581,6 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
                     max_items = int(email_cfg.get("max_items", 50))
 
                     # 收件人去重
-                    try:
-                        _ = _dedup_addrs
-                    except NameError:
-                        def _dedup_addrs(lst):
-                            s, out = set(), []
-                            for a in lst or []:
-                                a2 = a.lower()
-                                if a2 not in s:
-                                    s.add(a2); out.append(a)
-                            return out
                     to_list = _dedup_addrs(to_list)
 
                     if not (to_list and sender and passwd):
@@ -454,6 +592,7 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
                         if not items:
                             html_body += "<p>今日暂无新增命中。</p>"
                         else:
+                            from .email_template import render_email_html
                             html_body += render_email_html(
                                 items=items, lang=lang, translations=translations,
                                 summaries_zh=summaries_zh, summaries_en=summaries_en,
@@ -484,16 +623,20 @@ def run(config_path, categories, keywords, logic, max_results, sort_by, sort_ord
         # 8) —— 仅在“网页生成成功或邮件成功发送”后，才持久化去重状态 —— #
         try:
             if unique_only and state_path and items and (site_generated or email_sent):
-                all_seen = set(seen_ids)
-                for it in items:
-                    aid = it.get("id")
-                    if aid:
-                        all_seen.add(aid)
-                p = pathlib.Path(state_path)
-                p.parent.mkdir(parents=True, exist_ok=True)
-                with open(p, "w", encoding="utf-8") as f:
-                    json.dump({"ids": sorted(all_seen)}, f, ensure_ascii=False, indent=2)
-                click.echo(f"[Freshness] 更新去重状态，共 {len(all_seen)} 条 -> {state_path}")
+                # 只看本次真正新增的 ID；没有新增就不重写状态文件
+                new_ids = [aid for aid in dict.fromkeys(it.get("id") for it in items)
+                           if aid and aid not in seen_ids]
+                if not new_ids:
+                    click.echo("[Freshness] 无新增 ID，去重状态无需更新")
+                elif seen_bloom is not None:
+                    for aid in new_ids:
+                        seen_bloom.add(aid)
+                    seen_bloom.save(state_path)
+                    click.echo(f"[Freshness] 更新去重状态（bloom），共 {len(seen_bloom)} 条 -> {bloom_path_for(state_path)}")
+                else:
+                    all_seen = seen_ids.union(new_ids)
+                    write_seen_ids(state_path, sorted(all_seen))
+                    click.echo(f"[Freshness] 更新去重状态，共 {len(all_seen)} 条 -> {state_path}")
             elif unique_only and items:
                 click.echo("[Freshness] 未写入去重状态（本次既未成功发邮件也未生成站点）")
         except Exception as e:
@@ -4,8 +4,12 @@ from __future__ import annotations
 import os
 import time
 import random
+import threading
 import requests
+import urllib3
 from typing import Dict, Optional
+from xml.etree.ElementTree import ParseError
+from .session import get_session
 
 # 首选 HTTPS，失败时回退到 HTTP（某些网络下 HTTPS 易读超）
 ARXIV_HTTPS = "https://export.arxiv.org/api/query"
@@ -16,16 +20,33 @@ DEFAULT_TIMEOUT = float(os.getenv("ARXIV_TIMEOUT", "45"))      # 单次请求超
 MAX_ATTEMPTS    = int(os.getenv("ARXIV_MAX_ATTEMPTS", "6"))    # 尝试次数
 BASE_PAUSE      = float(os.getenv("ARXIV_PAUSE", "1.5"))       # 基础退避（秒）
 MAX_SLEEP       = float(os.getenv("ARXIV_MAX_SLEEP", "20"))    # 退避上限（秒）
+MIN_INTERVAL    = float(os.getenv("ARXIV_MIN_INTERVAL", "3"))  # 相邻两次请求发起的最小间隔（arXiv API 要求 ≥3s）
 
 RETRYABLE_STATUS = {429, 500, 502, 503, 504}
 
+# 流式读取/解析响应体时可能出现的错误（读超时、连接中断、XML 截断），这些发生在 _do_get 的重试之外
+STREAM_ERRORS = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ParseError, OSError)
+
 HEADERS = {
     # 写一个正常 UA，arXiv 官方建议标注用途；邮箱可去掉
     "User-Agent": os.getenv("ARXIV_UA", "arxiv-tracker/0.1 (+https://github.com/colorfulandcjy0806/Arxiv-tracker)"),
     "Accept": "application/atom+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
-_session = requests.Session()
+_throttle_lock = threading.Lock()
+_last_start = 0.0
+
+
+def _throttle() -> None:
+    """
+    进程内所有 arXiv 请求（含预取线程、重试）共享的节流：保证相邻两次请求发起间隔 ≥ MIN_INTERVAL。
+    """
+    global _last_start
+    with _throttle_lock:
+        wait = _last_start + MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_start = time.monotonic()
 
 
 def _sleep_backoff(attempt: int) -> None:
@@ -37,18 +58,23 @@ def _sleep_backoff(attempt: int) -> None:
     time.sleep(delay)
 
 
-def _do_get(base_url: str, params: Dict[str, str], timeout: Optional[float] = None) -> requests.Response:
+def _do_get(base_url: str, params: Dict[str, str], timeout: Optional[float] = None,
+            stream: bool = False, session: Optional[requests.Session] = None) -> requests.Response:
     """
     带重试的 GET：对超时/连接错误/部分 5xx&429 做重试。
+    stream=True 时只读完响应头即返回，响应体由调用方按需读取。
     """
     timeout = timeout or DEFAULT_TIMEOUT
+    session = session or get_session()
     last_err: Optional[Exception] = None
 
     for attempt in range(1, MAX_ATTEMPTS + 1):
         try:
-            resp = _session.get(base_url, params=params, headers=HEADERS, timeout=timeout)
+            _throttle()
+            resp = session.get(base_url, params=params, headers=HEADERS, timeout=timeout, stream=stream)
             # 主动对可重试状态码抛出异常，以走重试逻辑
             if resp.status_code in RETRYABLE_STATUS:
+                resp.close()
                 raise requests.exceptions.HTTPError(f"HTTP {resp.status_code}", response=resp)
             return resp  # 成功
         except (requests.exceptions.Timeout,
@@ -76,7 +102,8 @@ def fetch_arxiv_feed(query: str,
                      start: int = 0,
                      max_results: int = 10,
                      sort_by: str = "submittedDate",
-                     sort_order: str = "descending") -> str:
+                     sort_order: str = "descending",
+                     session: Optional[requests.Session] = None) -> str:
     """
     拉取 arXiv Atom Feed。先 HTTPS，失败则 HTTP 回退。
     """
@@ -91,7 +118,7 @@ def fetch_arxiv_feed(query: str,
     last_err: Optional[Exception] = None
     for base in (ARXIV_HTTPS, ARXIV_HTTP):
         try:
-            r = _do_get(base, params, timeout=DEFAULT_TIMEOUT)
+            r = _do_get(base, params, timeout=DEFAULT_TIMEOUT, session=session)
             r.raise_for_status()
             return r.text
         except Exception as e:
@@ -102,3 +129,40 @@ def fetch_arxiv_feed(query: str,
     # 两个 base 都失败
     assert last_err is not None
     raise last_err
+
+
+def open_arxiv_feed(query: str,
+                    start: int = 0,
+                    max_results: int = 10,
+                    sort_by: str = "submittedDate",
+                    sort_order: str = "descending",
+                    session: Optional[requests.Session] = None) -> requests.Response:
+    """
+    以流式方式打开 arXiv Atom Feed（HTTPS 失败回退 HTTP），返回未读取响应体的 Response。
+    配合 parser.iter_feed(resp.raw) 边下载边解析；用完需 resp.close()。
+    """
+    params = {
+        "search_query": query,
+        "start": str(start),
+        "max_results": str(max_results),
+        "sortBy": sort_by,
+        "sortOrder": sort_order,
+    }
+
+    last_err: Optional[Exception] = None
+    for base in (ARXIV_HTTPS, ARXIV_HTTP):
+        try:
+            r = _do_get(base, params, timeout=DEFAULT_TIMEOUT, stream=True, session=session)
+            try:
+                r.raise_for_status()
+            except Exception:
+                r.close()
+                raise
+            r.raw.decode_content = True  # 透明解压 gzip
+            return r
+        except Exception as e:
+            last_err = e
+            continue
+
+    assert last_err is not None
+    raise last_err
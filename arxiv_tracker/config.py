@@ -3,6 +3,13 @@ import yaml
 from dataclasses import dataclass, field
 from typing import List
 
+# libyaml 的 C 加载器快数倍；未编译 libyaml 时回退纯 Python 版本
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def yaml_load(f):
+    return yaml.load(f, Loader=_YAML_LOADER)
+
 @dataclass
 class Settings:
     categories: List[str] = field(default_factory=list)
@@ -15,8 +22,13 @@ class Settings:
     @classmethod
     def from_file(cls, path: str) -> "Settings":
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
+            data = yaml_load(f) or {}
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Settings":
+        """从已解析的配置 dict 构造（忽略非检索字段），避免重复解析 YAML"""
+        return cls(**{k: v for k, v in (data or {}).items() if k in cls.__annotations__})
 
     def merge_cli(
         self,
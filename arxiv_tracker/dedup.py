@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+去重状态的 Bloom filter 后端（可选，需要 pybloom-live）。
+- <state>.bloom       ：pickle 持久化的 ScalableBloomFilter（全部历史 ID）
+- <state>.recent.json ：最近 RECENT_KEEP 条 ID（精确查询，消除热门条目的误判）
+- <state>.json        ：精确的完整状态，照常只追加新 ID；回退/切回 json 后端时历史不丢
+"""
+import os, json, pickle, pathlib
+from typing import List
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except Exception:
+    ScalableBloomFilter = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+RECENT_KEEP = 500       # 侧车 JSON 保留的最近 ID 数
+ERROR_RATE = 0.01       # 目标误判率（~1%）
+
+
+def bloom_available() -> bool:
+    return ScalableBloomFilter is not None
+
+
+def bloom_path_for(state_path: str) -> str:
+    return os.path.splitext(state_path)[0] + ".bloom"
+
+
+def recent_path_for(state_path: str) -> str:
+    return os.path.splitext(state_path)[0] + ".recent.json"
+
+
+def read_seen_ids(path: str) -> List[str]:
+    """读取 JSON 去重状态（兼容 list / {"ids":[...]} / {id: timestamp} 三种格式），保持原顺序"""
+    if not path or not os.path.exists(path):
+        return []
+    if orjson is not None:
+        with open(path, "rb") as f:
+            j = orjson.loads(f.read()) or {}
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            j = json.load(f) or {}
+    if isinstance(j, dict) and "ids" in j:
+        return list(j.get("ids") or [])
+    if isinstance(j, dict):
+        return list(j.keys())
+    if isinstance(j, list):
+        return list(j)
+    return []
+
+
+def _atomic_write(path, data: bytes) -> None:
+    """先写临时文件再 os.replace 原子替换：中途失败不会留下截断的状态文件"""
+    p = pathlib.Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(p.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, p)
+
+
+def write_seen_ids(path: str, ids: List[str], indent: bool = False) -> None:
+    """写入 JSON 去重状态 {"ids": [...]}（默认紧凑格式）；有 orjson 时用其序列化"""
+    if orjson is not None:
+        data = orjson.dumps({"ids": list(ids)}, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps({"ids": list(ids)}, ensure_ascii=False,
+                          indent=2 if indent else None,
+                          separators=None if indent else (",", ":")).encode("utf-8")
+    _atomic_write(path, data)
+
+
+class BloomSeen:
+    """只支持 `in` / add / len 的已见集合；先查最近 ID（精确），再查 Bloom filter"""
+
+    def __init__(self, bf, recent: List[str]):
+        self.bf = bf
+        self.recent = list(recent)[-RECENT_KEEP:]
+        self._recent_set = set(self.recent)
+        self._added: List[str] = []   # 本进程新增、尚未写入精确状态的 ID
+
+    def __contains__(self, aid) -> bool:
+        return aid in self._recent_set or aid in self.bf
+
+    def __len__(self) -> int:
+        return len(self.bf)
+
+    def add(self, aid: str) -> None:
+        self.bf.add(aid)
+        if aid not in self._recent_set:
+            self.recent.append(aid)
+            self._recent_set.add(aid)
+            self._added.append(aid)
+
+    @classmethod
+    def load(cls, state_path: str) -> "BloomSeen":
+        if not bloom_available():
+            raise RuntimeError("Bloom 去重需要安装 pybloom-live（pip install pybloom-live）")
+        bpath = bloom_path_for(state_path)
+        rpath = recent_path_for(state_path)
+        if os.path.exists(bpath):
+            with open(bpath, "rb") as f:
+                bf = pickle.load(f)
+            recent = read_seen_ids(rpath) if os.path.exists(rpath) else read_seen_ids(state_path)[-RECENT_KEEP:]
+        else:
+            # 首次启用：用已有 JSON 中的全部 ID 初始化
+            recent = read_seen_ids(state_path)
+            bf = ScalableBloomFilter(mode=ScalableBloomFilter.SMALL_SET_GROWTH, error_rate=ERROR_RATE)
+            for aid in recent:
+                bf.add(aid)
+        return cls(bf, recent)
+
+    def save(self, state_path: str) -> None:
+        _atomic_write(bloom_path_for(state_path), pickle.dumps(self.bf, protocol=pickle.HIGHEST_PROTOCOL))
+        write_seen_ids(recent_path_for(state_path), self.recent[-RECENT_KEEP:])
+        if self._added:
+            # 精确状态只追加（不排序），不截断
+            ids = read_seen_ids(state_path)
+            write_seen_ids(state_path, list(dict.fromkeys(ids + self._added)))
+            self._added = []
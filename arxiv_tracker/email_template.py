@@ -50,6 +50,8 @@ CSS = """
 .section h4{margin:4px 0 6px 0;font-size:14px}
 """
 
+_EMPTY: Dict[str, str] = {}  # 只读占位，避免每张卡片反复新建 {}
+
 def _render_card(it: Dict[str, Any],
                  t_zh: Optional[Dict[str, str]] = None,
                  sum_zh: Optional[Dict[str, str]] = None,
@@ -62,13 +64,14 @@ def _render_card(it: Dict[str, Any],
     upd = it.get("updated") or "—"
     comments = it.get("comments") or ""
     summary = it.get("summary") or ""
+    t_zh, sum_zh, sum_en = t_zh or _EMPTY, sum_zh or _EMPTY, sum_en or _EMPTY
 
-    zh_title = (t_zh or {}).get("title_zh")
-    zh_sum   = (t_zh or {}).get("summary_zh")
+    zh_title = t_zh.get("title_zh")
+    zh_sum   = t_zh.get("summary_zh")
 
     # 新双语总结
-    digest_en = (sum_en or {}).get("digest_en") or (sum_zh or {}).get("digest_en") or ""
-    digest_zh = (sum_zh or {}).get("digest_zh") or (sum_en or {}).get("digest_zh") or ""
+    digest_en = sum_en.get("digest_en") or sum_zh.get("digest_en") or ""
+    digest_zh = sum_zh.get("digest_zh") or sum_en.get("digest_zh") or ""
 
     out = [f'<div class="card">']
     out.append(f'<div class="title"><a href="{_esc(title_link)}">{_esc(title)}</a></div>')
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import re
 import requests
+from .session import get_session
 
 UA = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -21,23 +22,23 @@ def _extract_from_text(s: str):
         return []
     return [_norm_url(m.group(0)) for m in _RE_CODE_URL.finditer(s)]
 
-def _get(url: str, timeout: int = 10):
-    return requests.get(
+def _get(url: str, timeout: int = 10, session=None):
+    return (session or get_session()).get(
         url,
         headers={"User-Agent": UA, "Accept": "*/*"},
         timeout=timeout,
         allow_redirects=True,
     )
 
-def _extract_from_html(url: str, timeout: int):
+def _extract_from_html(url: str, timeout: int, session=None):
     try:
-        r = _get(url, timeout=timeout)
+        r = _get(url, timeout=timeout, session=session)
         r.raise_for_status()
         return _extract_from_text(r.text)
     except Exception:
         return []
 
-def _extract_from_pdf_head(pdf_url: str, timeout: int, head_bytes: int = 256 * 1024):
+def _extract_from_pdf_head(pdf_url: str, timeout: int, head_bytes: int = 256 * 1024, session=None):
     """
     只取 PDF 前 head_bytes（默认 256KB），用 bytes 正则匹配 URL。
     """
@@ -47,7 +48,7 @@ def _extract_from_pdf_head(pdf_url: str, timeout: int, head_bytes: int = 256 * 1
             "Range": f"bytes=0-{head_bytes-1}",
             "Accept": "application/pdf,*/*",
         }
-        r = requests.get(pdf_url, headers=headers, timeout=timeout, allow_redirects=True)
+        r = (session or get_session()).get(pdf_url, headers=headers, timeout=timeout, allow_redirects=True)
         # 某些服务器对 Range 不支持会返回 200；也可接受
         if r.status_code not in (200, 206):
             return []
@@ -78,6 +79,7 @@ def augment_item_links(
     pdf_if_missing: bool = True,   # << 关键开关：仅在“没有 code 链接时”才去扫 PDF
     pdf_first_page: bool = False,  # 始终扫 PDF（不建议默认开，性能差）
     timeout: int = 10,
+    session: requests.Session = None,  # 默认使用进程内共享连接池
 ) -> int:
     """
     返回本次新增的链接条数
@@ -92,14 +94,14 @@ def augment_item_links(
 
     # 2) 再尝试 HTML 页
     if html and item.get("html_url"):
-        code_urls += _extract_from_html(item["html_url"], timeout=timeout)
+        code_urls += _extract_from_html(item["html_url"], timeout=timeout, session=session)
 
     code_urls = _dedup(code_urls)
 
     # 3) 仅当目前还没有 code 链接时，再去扫 PDF 头
     need_pdf = (pdf_if_missing and len(code_urls) == 0) or pdf_first_page
     if need_pdf and item.get("pdf_url"):
-        code_urls += _extract_from_pdf_head(item["pdf_url"], timeout=timeout)
+        code_urls += _extract_from_pdf_head(item["pdf_url"], timeout=timeout, session=session)
         code_urls = _dedup(code_urls)
 
     item["code_urls"] = code_urls
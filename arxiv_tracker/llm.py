@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import os, json, re, requests
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from .session import get_session
 
 # ========== 通用小工具 ==========
 
@@ -22,6 +23,22 @@ def _json_loose(s: str) -> Dict[str, Any]:
         except Exception:
             return {}
 
+def _json_array_loose(s: str) -> List[Any]:
+    """
+    宽松 JSON 数组解析：尽力从文本中抽出首个 [...]；失败返回空列表。
+    """
+    m = re.search(r"\[[\s\S]*\]", s)
+    if not m:
+        return []
+    raw = m.group(0)
+    for t in (raw, re.sub(r",\s*([}\]])", r"\1", raw)):
+        try:
+            data = json.loads(t)
+            return data if isinstance(data, list) else []
+        except Exception:
+            continue
+    return []
+
 def _loose_json_load(s: str) -> Dict[str, Any]:
     """兼容旧名，等价 _json_loose。"""
     return _json_loose(s)
@@ -52,10 +69,12 @@ def _chat_completions_request(
     temperature: float = 0.2,
     max_tokens: int = 1024,
     timeout: int = 30,
+    session: Optional[requests.Session] = None,
 ) -> str:
     """
     统一的 OpenAI 兼容 Chat Completions 请求（requests 直连）。
     适配 DeepSeek / SiliconFlow / 其他 OAI 兼容服务。
+    默认复用进程内共享 Session 的连接池（并发调用时避免重复握手）。
     """
     url = _normalize_chat_endpoint(base_url)
     headers = {
@@ -69,7 +88,7 @@ def _chat_completions_request(
         "max_tokens": max_tokens,
         "stream": False,
     }
-    resp = requests.post(url, json=payload, headers=headers, timeout=timeout)
+    resp = (session or get_session()).post(url, json=payload, headers=headers, timeout=timeout)
     resp.raise_for_status()
     data = resp.json()
 
@@ -206,7 +225,8 @@ def call_llm_two_stage(item: Dict[str, Any], lang: str, scope: str,
 
 def call_llm_translate(item: Dict[str, Any], target_lang: str,
                        base_url: str, model: str, api_key: str,
-                       system_prompt: str = "") -> Dict[str, str]:
+                       system_prompt: str = "",
+                       session: Optional[requests.Session] = None) -> Dict[str, str]:
     """
     返回：{ title_zh?, summary_zh?, comments_zh? }
     —— 同一 OpenAI 兼容通道，按任意 base_url + api_key 工作。
@@ -233,10 +253,12 @@ DATA:
                 {"role":"user","content":inst}]
     text = _chat_completions_request(
         base_url=base_url, api_key=api_key, model=model, messages=messages,
-        temperature=0.0, max_tokens=600
+        temperature=0.0, max_tokens=600, session=session
     ).strip()
 
-    data = _loose_json_load(text)
+    return _pick_translation(_loose_json_load(text))
+
+def _pick_translation(data: Any) -> Dict[str, str]:
     out: Dict[str, str] = {}
     if isinstance(data, dict):
         if "title_zh" in data and isinstance(data["title_zh"], str):
@@ -246,3 +268,59 @@ DATA:
         if "comments_zh" in data and isinstance(data["comments_zh"], str):
             out["comments_zh"] = data["comments_zh"].strip()
     return out
+
+def call_llm_translate_batch(items: List[Dict[str, Any]], target_lang: str,
+                             base_url: str, model: str, api_key: str,
+                             system_prompt: str = "",
+                             session: Optional[requests.Session] = None) -> Dict[str, Dict[str, str]]:
+    """
+    一次请求翻译多篇（减少往返与 prefill 次数）。
+    返回：{ item_id: { title_zh?, summary_zh?, comments_zh? } }，只含成功解析的条目；
+    调用方应对缺失的条目回退到 call_llm_translate。整体无法解析时抛 ValueError。
+    """
+    sys_prompt = system_prompt or (
+        "You are a precise academic translator. Translate to Simplified Chinese concisely and faithfully; keep technical terms."
+    )
+    payload = [
+        {"i": i, "title": it.get("title") or "", "summary": it.get("summary") or "",
+         "comments": it.get("comments") or ""}
+        for i, it in enumerate(items, 1)
+    ]
+    inst = f"""
+Translate each of the following {len(items)} papers into Simplified Chinese.
+Return ONLY a compact JSON array with one object per paper, in the same order:
+[{{"i": <number>, "title_zh": "...", "summary_zh": "...", "comments_zh": "..."}}, ...]
+Omit "comments_zh" when comments is empty. Do not add commentary.
+
+DATA:
+{json.dumps(payload, ensure_ascii=False, indent=2)}
+""".strip()
+
+    messages = [{"role":"system","content":sys_prompt},
+                {"role":"user","content":inst}]
+    n = len(items)
+    text = _chat_completions_request(
+        base_url=base_url, api_key=api_key, model=model, messages=messages,
+        temperature=0.0, max_tokens=600 * n, timeout=max(30, 20 * n), session=session
+    ).strip()
+
+    rows = [r for r in _json_array_loose(text) if isinstance(r, dict)]
+    if not rows:
+        raise ValueError("batch translation: no JSON array in response")
+
+    out: Dict[str, Dict[str, str]] = {}
+    # 仅当返回行数与输入一致时，才允许对缺失/越界编号的行按位置对齐；
+    # 否则这些行丢弃，对应条目由调用方逐条补译，避免译文错配到别的论文
+    by_pos = len(rows) == n
+    for pos, row in enumerate(rows):
+        i = row.get("i")
+        if isinstance(i, int) and 1 <= i <= n:
+            idx = i - 1
+        elif by_pos:
+            idx = pos
+        else:
+            continue
+        tx = _pick_translation(row)
+        if tx:
+            out[items[idx].get("id") or ""] = tx
+    return out
@@ -1,18 +1,37 @@
 # -*- coding: utf-8 -*-
 import os, json, datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+MD_HEADER = "# arXiv 检索结果 / Results\n"
 
 def _ensure_dir(p: str):
     os.makedirs(p, exist_ok=True)
 
-def save_json(items: List[Dict[str, Any]], out_dir: str) -> str:
+def output_paths(out_dir: str) -> Tuple[str, str]:
+    """同一时间戳下的 (json_path, md_path)，保证同一次运行的两个文件 stamp 一致"""
     _ensure_dir(out_dir)
     ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = os.path.join(out_dir, f"arxiv_{ts}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(items, f, ensure_ascii=False, indent=2)
+    return (os.path.join(out_dir, f"arxiv_{ts}.json"),
+            os.path.join(out_dir, f"arxiv_{ts}.md"))
+
+def write_json(items: List[Dict[str, Any]], path: str) -> str:
+    # 有 orjson 时一次性序列化写出（与 json.dump(indent=2, ensure_ascii=False) 输出一致）
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(items, f, ensure_ascii=False, indent=2)
     return path
 
+def save_json(items: List[Dict[str, Any]], out_dir: str) -> str:
+    return write_json(items, output_paths(out_dir)[0])
+
 def _render_lang_block(lang_label: str, it: Dict[str, Any],
                        summ: Optional[Dict[str, str]],
                        trans: Optional[Dict[str, str]]):
@@ -35,44 +54,52 @@ def _render_lang_block(lang_label: str, it: Dict[str, Any],
         lines.append("")
     return lines
 
-def save_markdown(items: List[Dict[str, Any]], out_dir: str,
+def markdown_item(i: int, it: Dict[str, Any],
                   summaries_zh: Dict[str, Dict[str, str]] = None,
                   summaries_en: Dict[str, Dict[str, str]] = None,
                   lang: str = "both",
                   translations: Dict[str, Dict[str, str]] = None) -> str:
-    _ensure_dir(out_dir)
-    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = os.path.join(out_dir, f"arxiv_{ts}.md")
-    lines = ["# arXiv 检索结果 / Results", ""]
-    for i, it in enumerate(items, 1):
-        au = ", ".join(it.get("authors", []))
-        title = it.get("title", "")
-        venue = it.get("venue_inferred") or (it.get("journal_ref") or "")
-        pub = it.get("published", "")
-        upd = it.get("updated", "")
-        lines.append(f"## {i}. {title}")
-        lines.append(f"- Authors：{au}")
-        if venue:
-            lines.append(f"- Venue：{venue}")
-        if it.get("comments"):
-            lines.append(f"- Comments：{it['comments']}")
-        lines.append(f"- First：{pub or '—'}；Latest：{upd or '—'}")
-        if it.get("html_url"):
-            lines.append(f"- Abs：{it['html_url']}")
-        if it.get("pdf_url"):
-            lines.append(f"- PDF：{it['pdf_url']}")
-        if it.get("code_urls"):
-            lines.append(f"- Code：{', '.join(it['code_urls'])}")
-        if it.get("project_urls"):
-            lines.append(f"- Project：{', '.join(it['project_urls'])}")
+    """单条目的 Markdown 片段（以换行开头，可直接追加写入到 MD_HEADER 之后）"""
+    au = ", ".join(it.get("authors", []))
+    title = it.get("title", "")
+    venue = it.get("venue_inferred") or (it.get("journal_ref") or "")
+    pub = it.get("published", "")
+    upd = it.get("updated", "")
+    lines = [""]
+    lines.append(f"## {i}. {title}")
+    lines.append(f"- Authors：{au}")
+    if venue:
+        lines.append(f"- Venue：{venue}")
+    if it.get("comments"):
+        lines.append(f"- Comments：{it['comments']}")
+    lines.append(f"- First：{pub or '—'}；Latest：{upd or '—'}")
+    if it.get("html_url"):
+        lines.append(f"- Abs：{it['html_url']}")
+    if it.get("pdf_url"):
+        lines.append(f"- PDF：{it['pdf_url']}")
+    if it.get("code_urls"):
+        lines.append(f"- Code：{', '.join(it['code_urls'])}")
+    if it.get("project_urls"):
+        lines.append(f"- Project：{', '.join(it['project_urls'])}")
 
-        sid = it.get("id") or ""
-        trans = translations.get(sid) if translations else None
-        if lang in ("zh", "both"):
-            lines.extend(_render_lang_block("中文", it, (summaries_zh or {}).get(sid), trans))
-        if lang in ("en", "both"):
-            lines.extend(_render_lang_block("English", it, (summaries_en or {}).get(sid), None))
-        lines.append("")
+    sid = it.get("id") or ""
+    trans = translations.get(sid) if translations else None
+    if lang in ("zh", "both"):
+        lines.extend(_render_lang_block("中文", it, (summaries_zh or {}).get(sid), trans))
+    if lang in ("en", "both"):
+        lines.extend(_render_lang_block("English", it, (summaries_en or {}).get(sid), None))
+    lines.append("")
+    return "\n".join(lines)
+
+def save_markdown(items: List[Dict[str, Any]], out_dir: str,
+                  summaries_zh: Dict[str, Dict[str, str]] = None,
+                  summaries_en: Dict[str, Dict[str, str]] = None,
+                  lang: str = "both",
+                  translations: Dict[str, Dict[str, str]] = None) -> str:
+    path = output_paths(out_dir)[1]
+    # 逐条流式写入，不在内存中拼接整份文档
     with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(MD_HEADER)
+        for i, it in enumerate(items, 1):
+            f.write(markdown_item(i, it, summaries_zh, summaries_en, lang=lang, translations=translations))
     return path
@@ -1,53 +1,89 @@
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
-import feedparser
+import io
+from typing import List, Dict, Any, Iterator, IO, Optional
+from xml.etree.ElementTree import iterparse, ParseError
 from dateutil import parser as dtp
 from .extractors import extract_venue_info, extract_urls
 
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_ENTRY = _ATOM + "entry"
+
+
+def _text(e, tag: str) -> Optional[str]:
+    x = e.find(tag)
+    if x is None or x.text is None:
+        return None
+    return x.text.strip()
+
+
+def _build_item(e) -> Dict[str, Any]:
+    title = (_text(e, _ATOM + "title") or "").replace("\n", " ").strip()
+    authors = [(_text(a, _ATOM + "name") or "") for a in e.findall(_ATOM + "author")]
+    published = _text(e, _ATOM + "published")
+    updated   = _text(e, _ATOM + "updated")
+    published_iso = dtp.parse(published).isoformat() if published else None
+    updated_iso   = dtp.parse(updated).isoformat() if updated else None
+
+    html_url = None
+    pdf_url  = None
+    for link in e.findall(_ATOM + "link"):
+        if link.get("rel") == "alternate":
+            html_url = link.get("href")
+        if (link.get("title") or "").lower() == "pdf" or link.get("type") == "application/pdf":
+            pdf_url = link.get("href")
+
+    comments = _text(e, _ARXIV + "comment") or ""
+    journal_ref = _text(e, _ARXIV + "journal_ref")
+    pc = e.find(_ARXIV + "primary_category")
+    primary_cat = (pc.get("term") if pc is not None else None) or None
+    categories = [t.get("term") for t in e.findall(_ATOM + "category") if t.get("term")]
+    summary = _text(e, _ATOM + "summary") or ""
+
+    venue = extract_venue_info(f"{comments or ''} {journal_ref or ''}")
+    url_info = extract_urls(f"{comments or ''}\n{summary}")
+
+    return {
+        "id": _text(e, _ATOM + "id"),
+        "title": title,
+        "authors": authors,
+        "primary_category": primary_cat,
+        "categories": categories,
+        "published": published_iso,   # 首次提交
+        "updated": updated_iso,       # 最新提交
+        "comments": comments,
+        "journal_ref": journal_ref,
+        "venue_inferred": venue,      # 从 comments/journal_ref 推断中的会信息
+        "summary": summary,
+        "html_url": html_url,
+        "pdf_url": pdf_url,
+        "code_urls": url_info.get("code_urls", []),
+        "project_urls": url_info.get("project_urls", []),
+        "other_urls": [u for u in url_info.get("all_urls", []) if u not in set(url_info.get("code_urls", []) + url_info.get("project_urls", []))],
+    }
+
+
+def iter_feed(stream: IO[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    流式解析 arXiv Atom Feed：边读边解析，每解析完一个 <entry> 就产出一条。
+    调用方可随时 break/close，剩余内容不再读取与解析；已处理的 entry 立即释放。
+    """
+    for _event, elem in iterparse(stream, events=("end",)):
+        if elem.tag != _ENTRY:
+            continue
+        item = _build_item(elem)
+        elem.clear()
+        yield item
+
+
 def parse_feed(xml_text: str) -> List[Dict[str, Any]]:
-    feed = feedparser.parse(xml_text)
-    items: List[Dict[str, Any]] = []
-    for e in feed.entries:
-        title = (e.title or "").replace("\n", " ").strip()
-        authors = [a.get("name", "") for a in e.get("authors", [])] if "authors" in e else []
-        published = e.get("published")
-        updated   = e.get("updated")
-        published_iso = dtp.parse(published).isoformat() if published else None
-        updated_iso   = dtp.parse(updated).isoformat() if updated else None
-
-        html_url = None
-        pdf_url  = None
-        for link in e.get("links", []):
-            if link.get("rel") == "alternate":
-                html_url = link.get("href")
-            if link.get("title", "").lower() == "pdf" or link.get("type") == "application/pdf":
-                pdf_url = link.get("href")
-
-        comments = getattr(e, "arxiv_comment", None) or ""
-        journal_ref = getattr(e, "arxiv_journal_ref", None)
-        primary_cat = getattr(getattr(e, "arxiv_primary_category", {}), "term", None) or None
-        categories = [t.get("term") for t in e.get("tags", []) if t.get("term")]
-
-        venue = extract_venue_info(f"{comments or ''} {journal_ref or ''}")
-        url_info = extract_urls(f"{comments or ''}\n{getattr(e, 'summary', '')}")
-
-        item = {
-            "id": e.get("id"),
-            "title": title,
-            "authors": authors,
-            "primary_category": primary_cat,
-            "categories": categories,
-            "published": published_iso,   # 首次提交
-            "updated": updated_iso,       # 最新提交
-            "comments": comments,
-            "journal_ref": journal_ref,
-            "venue_inferred": venue,      # 从 comments/journal_ref 推断中的会信息
-            "summary": getattr(e, "summary", ""),
-            "html_url": html_url,
-            "pdf_url": pdf_url,
-            "code_urls": url_info.get("code_urls", []),
-            "project_urls": url_info.get("project_urls", []),
-            "other_urls": [u for u in url_info.get("all_urls", []) if u not in set(url_info.get("code_urls", []) + url_info.get("project_urls", []))],
-        }
-        items.append(item)
-    return items
+    """完整文本解析；XML 截断/不规范时保留出错前已解析的条目（与原 feedparser 的宽容行为一致）"""
+    if not xml_text:
+        return []
+    out: List[Dict[str, Any]] = []
+    try:
+        for item in iter_feed(io.BytesIO(xml_text.encode("utf-8"))):
+            out.append(item)
+    except ParseError:
+        pass
+    return out
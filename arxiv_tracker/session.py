@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+进程内共享的 requests.Session：arXiv 查询 / 补链 / LLM 请求复用同一连接池，
+keep-alive 复用 TCP+TLS 连接，避免每次请求重新握手。
+"""
+import socket
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+from . import __version__
+
+POOL_SIZE = 32          # 每个 host 的连接池大小（≥ 各线程池并发数）
+KEEPALIVE_IDLE = 3      # TCP keepalive 空闲探测间隔（秒）
+
+_session = None
+_lock = threading.Lock()
+
+
+def _socket_options():
+    opts = list(HTTPConnection.default_socket_options)
+    opts.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # TCP_KEEPIDLE/KEEPINTVL 仅 Linux 等平台提供
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        opts.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        opts.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_IDLE))
+    return opts
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _socket_options())
+        return super().init_poolmanager(*args, **kwargs)
+
+
+def get_session() -> requests.Session:
+    """
+    返回模块级共享 Session（线程安全的惰性初始化）。
+    适配器只对“连接失败”重试（请求尚未发出，对 POST 也安全）；
+    状态码/读超时的重试仍由各调用方自行处理（如 client._do_get 的退避）。
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                s = requests.Session()
+                retry = Retry(total=2, connect=2, read=0, status=0, redirect=5, backoff_factor=0.5)
+                adapter = _KeepAliveAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                s.headers["User-Agent"] = f"arxiv-tracker/{__version__}"
+                _session = s
+    return _session
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 import os, re
 from typing import Dict, Any, Optional
-from .llm import call_llm_two_stage
-from .llm import call_llm_bilingual_summary
 
 KNOWN_DATASETS = [
     "COCO","LVIS","ADE20K","Cityscapes","ScanNet","ImageNet","OpenImages",
@@ -90,6 +88,7 @@ def llm_two_stage(item: Dict[str, Any], lang: str, scope: str, cfg: Dict[str, An
     if not api_key:
         raise RuntimeError("未找到 LLM API Key，请设置环境变量：{}，或在 config.yaml 的 llm.api_key 填入（仅本机测试用）"
                            .format(cfg.get("api_key_env") or "OPENAI_API_KEY"))
+    from .llm import call_llm_two_stage
     return call_llm_two_stage(
         item=item, lang=lang, scope=scope,
         base_url=cfg.get("base_url", ""),
@@ -108,6 +107,7 @@ def build_two_stage_summary(item: Dict[str, Any], mode: str, lang: str, scope: s
         cfg = llm_cfg or {}
         api_key = (cfg.get("api_key") or os.getenv(cfg.get("api_key_env") or "OPENAI_API_KEY", ""))
         if api_key:
+            from .llm import call_llm_bilingual_summary  # 仅 LLM 模式加载
             try:
                 data = call_llm_bilingual_summary(
                     item=item,